@@ -1,22 +1,35 @@
 from dotenv import load_dotenv
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 import os
+import shutil
 import logging
-
-from utils.video_processing.video_to_audio import download_audio_from_youtube, split_audio_to_chunks
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from threading import Event, Lock
+
+from utils.video_processing.video_to_audio import (
+    download_audio_from_youtube,
+    split_audio_to_chunks,
+    split_stream_to_chunks
+)
 from utils.video_processing.audio_to_text import (
+    OUTPUT_TRANSCRIPT,
     get_youtube_transcript,
     save_youtube_transcript,
-    transcribe_audio_to_text,
+    iter_audio_transcription,
     cleanup_temp
 )
-from utils.text_preprocessing.translator import translate_to_eng
-from utils.text_preprocessing.cleaner import clean_and_save_transcript
+from utils.text_preprocessing.translator import translate_text
+from utils.text_preprocessing.cleaner import clean_text
 from utils.text_preprocessing.chunker import chunk_and_save
 from utils.text_preprocessing.vectorizer import vectorize_chunks
 from utils.llm_features.summarizer import generate_summary
-from utils.llm_features.notes_generator import generate_detailed_notes
+from utils.llm_features.notes_generator import generate_detailed_notes, stream_detailed_notes
 from utils.llm_features.qna_generator import answer_question, get_qna_status
+from utils.file_cache import read_file_cached, has_meaningful_content
+from utils.request_coalescer import RequestCoalescer
 
 load_dotenv()
 
@@ -30,32 +43,101 @@ app = Flask(__name__)
 os.makedirs("data/uploads", exist_ok=True)
 os.makedirs("data/transcripts", exist_ok=True)
 
+ENGLISH_TRANSCRIPT = "data/transcripts/transcript_english.txt"
+CLEANED_TRANSCRIPT = "data/transcripts/transcript_cleaned.txt"
+CHUNKS_DIR = "data/text chunks"
+
+# In-memory record of background pipeline progress, set by the pipeline stages
+PROCESSING_STATE = {
+    "transcribed": Event(),
+    "translated": Event(),
+    "cleaned": Event(),
+    "chunked": Event(),
+    "vectorized": Event()
+}
+
+def reset_processing_state():
+    """Clear all pipeline stage flags before a new video is processed"""
+    for stage_event in PROCESSING_STATE.values():
+        stage_event.clear()
+
+def seed_processing_state():
+    """Set the flags of stages whose outputs survive from before a restart, in pipeline order"""
+    stage_outputs = [
+        ("transcribed", lambda: has_meaningful_content(OUTPUT_TRANSCRIPT)),
+        ("translated", lambda: has_meaningful_content(ENGLISH_TRANSCRIPT)),
+        ("cleaned", lambda: has_meaningful_content(CLEANED_TRANSCRIPT)),
+        ("chunked", lambda: any(name.startswith("chunk_") for name in os.listdir(CHUNKS_DIR))),
+        ("vectorized", lambda: os.path.exists(os.path.join(CHUNKS_DIR, "embeddings.pkl")))
+    ]
+    for stage, output_ready in stage_outputs:
+        try:
+            if not output_ready():
+                break
+        except OSError:
+            break  # output missing
+        PROCESSING_STATE[stage].set()
+
+seed_processing_state()
+
+# Shared worker pool for the background pipeline stages, one worker per stage
+BG_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bg")
+
+# Futures of the current pipeline run, used to report stage failures
+PIPELINE_FUTURES = []
+
+# Non-fatal problems of the current run (e.g. batches left untranslated), shown with its status
+PIPELINE_WARNINGS = []
+
+# Held from the moment /process accepts a video until the last stage of its pipeline finishes.
+# Runs share the upload chunks, output files and PROCESSING_STATE, so only one may be in flight.
+PIPELINE_LOCK = Lock()
+
+def is_pipeline_running():
+    """True while a video is being split, transcribed or processed"""
+    return PIPELINE_LOCK.locked()
+
+# Concurrent requests for the same heavy result share one model run
+request_coalescer = RequestCoalescer()
+
+# Rendered HTML of the static pages, filled on first request
+_STATIC_PAGES = {}
+
+def render_static_page(template_name):
+    """Render a context-free template once and serve the cached HTML afterwards"""
+    if app.debug:
+        return render_template(template_name)  # pick up template edits while developing
+    page = _STATIC_PAGES.get(template_name)
+    if page is None:
+        page = _STATIC_PAGES[template_name] = render_template(template_name)
+    return page
+
 # ------------------- ROUTES -------------------
 
 @app.route('/transcript')
 def transcript():
     """Transcript Page"""
-    return render_template('transcript.html')
+    return render_static_page('transcript.html')
 
 @app.route('/summarize_page')
 def summarize_page():
     """Summarize Page"""
-    return render_template('summary.html')
+    return render_static_page('summary.html')
 
 @app.route('/notes')
 def notes():
     """Notes Page"""
-    return render_template('notes.html')
+    return render_static_page('notes.html')
 
 @app.route('/qna')
 def qna():
     """Q&A Page"""
-    return render_template('qna.html')
+    return render_static_page('qna.html')
 
 @app.route('/')
 def home():
     """Home Page"""
-    return render_template('home.html')
+    return render_static_page('home.html')
 
 @app.route('/process', methods=['POST'])
 def process_video():
@@ -63,9 +145,14 @@ def process_video():
     youtube_url = request.form.get('video_url')
     file = request.files.get('video_file')
 
-    try:
-        transcript_path = None
+    if not PIPELINE_LOCK.acquire(blocking=False):
+        return jsonify({
+            'status': 'error',
+            'message': 'Another video is still being processed. Please wait for it to finish.'
+        }), 409
 
+    pipeline_started = False
+    try:
         # === Case 1: YouTube URL provided ===
         if youtube_url:
             print("[INFO] YouTube URL received, attempting transcript fetch...")
@@ -73,105 +160,272 @@ def process_video():
 
             if text:
                 # Captions available then save directly
-                transcript_path = save_youtube_transcript(text)
+                save_youtube_transcript(text)
+                transcript_source = [text]
             else:
                 # No captions then fallback to Whisper
                 print("[INFO] Captions not available, using Whisper fallback...")
                 audio_path = download_audio_from_youtube(youtube_url)
                 chunks = split_audio_to_chunks(audio_path)
-                transcript_path = transcribe_audio_to_text(chunks)
-                cleanup_temp()
+                transcript_source = iter_audio_transcription(chunks)
 
         # === Case 2: Uploaded video file ===
         elif file:
             print("[INFO] Uploaded video file received, processing...")
-            upload_dir = "data/uploads"
-            os.makedirs(upload_dir, exist_ok=True)
-            upload_path = os.path.join(upload_dir, file.filename)
-            file.save(upload_path)
-
-            chunks = split_audio_to_chunks(upload_path)
-            transcript_path = transcribe_audio_to_text(chunks)
-            cleanup_temp()
+            try:
+                # Stream the upload into ffmpeg without saving the video first
+                chunks = split_stream_to_chunks(file.stream)
+            except (RuntimeError, OSError) as e:
+                # Containers that need seeking (e.g. MP4 with a trailing index) cannot be read from a pipe
+                if not file.stream.seekable():
+                    raise
+                print(f"[WARNING] Streaming split failed ({e}), saving upload first...")
+                file.stream.seek(0)
+                upload_dir = "data/uploads"
+                os.makedirs(upload_dir, exist_ok=True)
+                upload_path = os.path.join(upload_dir, file.filename)
+                file.save(upload_path)
+                chunks = split_audio_to_chunks(upload_path)
+            transcript_source = iter_audio_transcription(chunks)
 
         else:
             return jsonify({'status': 'error', 'message': 'No video or URL provided.'}), 400
 
-        # Start background processing immediately after transcript is ready
-        import threading
-        background_thread = threading.Thread(
-            target=background_processing, 
-            args=(transcript_path,)
-        )
-        background_thread.daemon = True
-        background_thread.start()
-
-        # Return success immediately with transcript info
-        if os.path.exists(transcript_path):
-            with open(transcript_path, 'r', encoding='utf-8') as f:
-                transcript_content = f.read()
-            
-            return jsonify({
-                'status': 'success',
-                'transcript_ready': True,
-                'transcript_path': transcript_path,
-                'message': 'Video processed successfully!',
-                'transcript_preview': transcript_content[:500] + "..." if len(transcript_content) > 500 else transcript_content
-            })
-        else:
-            return jsonify({'status': 'error', 'message': 'Transcript generation failed'}), 500
+        # Transcription and the later stages run in the background pipeline, which releases the lock
+        pipeline_start(transcript_source)
+        pipeline_started = True
+
+        # Captions are already saved; Whisper transcripts fill in while the pipeline runs
+        transcript_preview = None
+        if youtube_url and text:
+            transcript_preview = text[:500] + "..." if len(text) > 500 else text
+
+        return jsonify({
+            'status': 'success',
+            'transcript_ready': transcript_preview is not None,
+            'transcript_path': OUTPUT_TRANSCRIPT,
+            'message': 'Video processed successfully!',
+            'transcript_preview': transcript_preview
+        })
 
     except Exception as e:
         print(f"[ERROR] Processing failed: {e}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
-
-def background_processing(transcript_path):
-    """Run translation, cleaning, chunking and vectorization in background"""
+    finally:
+        if not pipeline_started:
+            PIPELINE_LOCK.release()
+
+# ------------------- BACKGROUND PIPELINE -------------------
+
+# Marks the end of the stream on every stage queue
+PIPELINE_END = None
+
+# Sent instead of PIPELINE_END when a stage failed, so later stages fail too
+PIPELINE_FAILED = object()
+
+class UpstreamStageFailed(Exception):
+    """Raised in a stage when an earlier stage of the same run failed"""
+
+# Translation is network-bound, so a few batches can be in flight at once;
+# translate_text keeps one shared request rate across all of them
+TRANSLATION_WORKERS = 4
+
+def pipeline_start(transcript_source):
+    """
+    Start the transcribe -> translate -> clean -> chunk+vectorize pipeline and return immediately.
+    Each stage runs on the shared BG_POOL and consumes the previous stage's queue,
+    so translation begins as soon as the first piece of transcript is ready.
+    """
+    print("[BACKGROUND] Starting background processing...")
+
+    # Clean up old files and stage flags first to avoid conflicts
+    cleanup_old_processing_files()
+    reset_processing_state()
+    PIPELINE_FUTURES.clear()
+    PIPELINE_WARNINGS.clear()
+
+    transcribed_queue, translated_queue, cleaned_queue = Queue(), Queue(), Queue()
+    stages = [
+        (transcribe_stage, (transcript_source, transcribed_queue)),
+        (translate_stage, (transcribed_queue, translated_queue)),
+        (clean_stage, (translated_queue, cleaned_queue)),
+        (chunk_and_vectorize_stage, (cleaned_queue,))
+    ]
+    PIPELINE_FUTURES[:] = [BG_POOL.submit(target, *args) for target, args in stages]
+
+def _iter_queue(stage_queue):
+    """Yield items from a stage queue until the end marker arrives"""
+    while True:
+        item = stage_queue.get()
+        if item is PIPELINE_END or item is PIPELINE_FAILED:
+            # Leave the marker in place so a later drain of this queue returns at once
+            stage_queue.put(item)
+            if item is PIPELINE_FAILED:
+                raise UpstreamStageFailed("An earlier processing stage failed")
+            return
+        yield item
+
+@contextmanager
+def _stage_output(path):
+    """Write a stage's output to a temp file that replaces path only once the stage succeeds"""
+    tmp_path = path + ".part"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _drain_queue(stage_queue):
+    """Discard the rest of a stage queue so the upstream thread never blocks"""
+    while stage_queue.get() not in (PIPELINE_END, PIPELINE_FAILED):
+        pass
+
+def transcribe_stage(transcript_source, out_queue):
+    """Pull transcript pieces from captions or Whisper and pass them on"""
+    end_marker = PIPELINE_FAILED
+    try:
+        for text in transcript_source:
+            out_queue.put(text)
+        PROCESSING_STATE["transcribed"].set()
+        end_marker = PIPELINE_END
+    except Exception as e:
+        print(f"[BACKGROUND ERROR] Transcription failed: {e}")
+        raise
+    finally:
+        cleanup_temp()
+        out_queue.put(end_marker)
+
+def _translate_or_keep(text, max_chars):
+    """Translate one batch, passing the original text on if the translation service fails"""
+    try:
+        return translate_text(text, max_chars=max_chars)
+    except Exception as e:
+        print(f"[BACKGROUND WARNING] Translation failed, keeping original text: {e}")
+        PIPELINE_WARNINGS.append(f"Part of the transcript could not be translated: {e}")
+        return text
+
+def translate_stage(in_queue, out_queue, max_chars=4000):
+    """
+    Translate transcript pieces to English, batching small pieces up to max_chars.
+    Batches are translated concurrently and passed on in their original order;
+    a batch that cannot be translated is passed on untranslated.
+    """
+    end_marker = PIPELINE_FAILED
     try:
-        print("[BACKGROUND] Starting background processing...")
-        
-        # Clean up old files first to avoid conflicts
-        cleanup_old_processing_files()
-        
-        # Translation
         print("[BACKGROUND] Translating to English...")
-        output_path = translate_to_eng(transcript_path)
-
-        # Cleaning english text
+        pending = deque()
+
+        def emit_translated(wait_all=False):
+            # Only the oldest batch may be written, so output order matches the transcript
+            while pending and (wait_all or pending[0].done()):
+                english_text = pending.popleft().result()
+                f.write(english_text if f.tell() == 0 else "\n" + english_text)
+                f.flush()
+                out_queue.put(english_text)
+
+        with _stage_output(ENGLISH_TRANSCRIPT) as f, \
+                ThreadPoolExecutor(max_workers=TRANSLATION_WORKERS, thread_name_prefix="translate") as pool:
+            buffer, buffered_chars = [], 0
+            for text in _iter_queue(in_queue):
+                buffer.append(text)
+                buffered_chars += len(text)
+                if buffered_chars >= max_chars:
+                    pending.append(pool.submit(_translate_or_keep, "\n".join(buffer), max_chars))
+                    buffer, buffered_chars = [], 0
+                emit_translated()
+
+            if buffer:
+                pending.append(pool.submit(_translate_or_keep, "\n".join(buffer), max_chars))
+            emit_translated(wait_all=True)
+        PROCESSING_STATE["translated"].set()
+        end_marker = PIPELINE_END
+    except UpstreamStageFailed:
+        raise
+    except Exception as e:
+        print(f"[BACKGROUND ERROR] Translation failed: {e}")
+        # Drain upstream so the transcription thread never blocks
+        _drain_queue(in_queue)
+        raise
+    finally:
+        out_queue.put(end_marker)
+
+def clean_stage(in_queue, out_queue):
+    """Clean translated pieces and append them to the cleaned transcript"""
+    end_marker = PIPELINE_FAILED
+    try:
         print("[BACKGROUND] Cleaning transcript...")
-        cleaned_path = clean_and_save_transcript(output_path)
+        with _stage_output(CLEANED_TRANSCRIPT) as f:
+            for i, english_text in enumerate(_iter_queue(in_queue)):
+                cleaned_text = clean_text(english_text)
+                if not cleaned_text:
+                    continue
+                f.write(cleaned_text if i == 0 else " " + cleaned_text)
+                f.flush()
+                out_queue.put(cleaned_text)
+        PROCESSING_STATE["cleaned"].set()
+        end_marker = PIPELINE_END
+    except UpstreamStageFailed:
+        raise
+    except Exception as e:
+        print(f"[BACKGROUND ERROR] Cleaning failed: {e}")
+        _drain_queue(in_queue)
+        raise
+    finally:
+        out_queue.put(end_marker)
+
+def chunk_and_vectorize_stage(in_queue):
+    """Chunk and vectorize once the full cleaned transcript is available"""
+    try:
+        # Overlapping chunks span piece boundaries, so wait for the whole text
+        for _ in _iter_queue(in_queue):
+            pass
+        if not PROCESSING_STATE["cleaned"].is_set():
+            print("[BACKGROUND ERROR] Cleaned transcript missing, skipping chunking")
+            return
 
         # Chunk cleaned transcript
         print("[BACKGROUND] Chunking transcript...")
-        chunks_dir = chunk_and_save(cleaned_path)
+        chunks_dir = chunk_and_save(CLEANED_TRANSCRIPT)
+        PROCESSING_STATE["chunked"].set()
 
         # Vectorize chunks
         print("[BACKGROUND] Vectorizing chunks...")
         vectorized_path = vectorize_chunks(chunks_dir)
+        if vectorized_path:
+            PROCESSING_STATE["vectorized"].set()
 
         print("[BACKGROUND] All processing completed successfully!")
-        
+
+    except UpstreamStageFailed:
+        print("[BACKGROUND] Skipping chunking, an earlier stage failed")
+        raise
     except Exception as e:
         print(f"[BACKGROUND ERROR] Background processing failed: {e}")
+        raise
+    finally:
+        # Last stage of the run; every earlier stage has already finished
+        PIPELINE_LOCK.release()
 
 def cleanup_old_processing_files():
     """Clean up old processing files to prevent conflicts"""
     try:
-        import glob
-        import shutil
-        
-        # Clean transcript files
-        transcript_files = [
-            "data/transcripts/transcript_english.txt",
-            "data/transcripts/cleaned_transcript.txt",
-            "data/transcripts/summary.txt",
-            "data/transcripts/detailed_notes.txt"
-        ]
+        # Clean transcript files, listing the directory once instead of a stat per file
+        transcripts_dir = "data/transcripts"
+        transcript_files = {
+            "transcript_english.txt",
+            "cleaned_transcript.txt",
+            "transcript_cleaned.txt",
+            "summary.txt",
+            "detailed_notes.txt"
+        }
         
-        for file_path in transcript_files:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                print(f"[CLEANUP] Removed: {file_path}")
+        with os.scandir(transcripts_dir) as entries:
+            stale_files = [entry.path for entry in entries if entry.name in transcript_files and entry.is_file()]
+        for file_path in stale_files:
+            os.remove(file_path)
+            print(f"[CLEANUP] Removed: {file_path}")
         
         # Clean chunks directory
         chunks_dir = "data/chunks"
@@ -187,21 +441,21 @@ def cleanup_old_processing_files():
 def check_processing_status():
     """Check if background processing is complete"""
     try:
-        # Check if all required files exist
-        required_files = [
-            "data/transcripts/transcript_english.txt",
-            "data/transcripts/cleaned_transcript.txt",
-            "data/chunks/chunk_0.txt"  # Check if at least one chunk exists
-        ]
+        # Read stage flags set by the pipeline stages
+        stages = {stage: stage_event.is_set() for stage, stage_event in PROCESSING_STATE.items()}
+        completed_files = [stage for stage, done in stages.items() if done]
+        errors = [str(future.exception()) for future in PIPELINE_FUTURES
+                  if future.done() and future.exception() is not None]
         
-        status = "processing"
-        completed_files = []
-        
-        for file_path in required_files:
-            if os.path.exists(file_path):
-                completed_files.append(file_path)
-        
-        if len(completed_files) == len(required_files):
+        if errors:
+            return jsonify({
+                'status': 'error',
+                'message': errors[0],
+                'stages': stages,
+                'completed_files': completed_files,
+                'total_files': len(stages)
+            })
+        elif len(completed_files) == len(stages):
             status = "completed"
         elif len(completed_files) > 0:
             status = "partial"
@@ -210,8 +464,10 @@ def check_processing_status():
             
         return jsonify({
             'status': status,
+            'stages': stages,
             'completed_files': completed_files,
-            'total_files': len(required_files)
+            'total_files': len(stages),
+            'warnings': list(PIPELINE_WARNINGS)
         })
         
     except Exception as e:
@@ -219,22 +475,7 @@ def check_processing_status():
     
 def is_current_processing_complete():
     """Check if current video processing is complete"""
-    try:
-        required_files = [
-            "data/transcripts/cleaned_transcript.txt",
-            "data/transcripts/transcript_english.txt"
-        ]
-        
-        # Check if files exist and have reasonable content
-        for file_path in required_files:
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                if content and len(content) > 50:
-                    return True
-        return False
-    except:
-        return False
+    return PROCESSING_STATE["cleaned"].is_set()
 
 @app.route('/summarize', methods=['POST'])
 def summarize_video():
@@ -242,8 +483,7 @@ def summarize_video():
         logger.info("Starting summary generation using preprocessed chunks")
         
         # Generate summary using preprocessed chunks
-        from utils.llm_features.summarizer import generate_summary
-        summary = generate_summary()
+        summary = request_coalescer.run("summary", generate_summary)
         
         word_count = len(summary.split())
         logger.info(f"Summary generated: {word_count} words")
@@ -278,8 +518,7 @@ def generate_notes():
         logger.info("Starting detailed notes generation using preprocessed chunks")
         
         # Generate detailed notes using preprocessed chunks
-        from utils.llm_features.notes_generator import generate_detailed_notes
-        result = generate_detailed_notes()
+        result = request_coalescer.run("notes", generate_detailed_notes)
         
         if result['status'] == 'success':
             notes = result['notes']
@@ -315,6 +554,48 @@ def generate_notes():
             "notes": None
         }), 500
 
+@app.route('/stream_notes', methods=['POST'])
+def stream_notes():
+    """Stream detailed notes section by section as plain text"""
+    try:
+        # Check if processing is complete
+        if not is_current_processing_complete():
+            return jsonify({
+                "status": "processing",
+                "message": "Video is still being processed. Please wait...",
+                "notes": None
+            }), 202  # Accepted but not ready
+        
+        result = stream_detailed_notes()
+        if result['status'] != 'success':
+            return jsonify({
+                "status": result['status'],
+                "message": result['message'],
+                "notes": None
+            }), 400
+        
+        def generate():
+            sections = []
+            for section in result['notes']:
+                sections.append(section)
+                yield section
+            
+            # Save notes to file once the last section is sent
+            notes_path = "data/transcripts/detailed_notes.txt"
+            os.makedirs("data/transcripts", exist_ok=True)
+            with open(notes_path, "w", encoding="utf-8") as f:
+                f.write("".join(sections))
+        
+        return Response(stream_with_context(generate()), mimetype='text/plain')
+        
+    except Exception as e:
+        logger.error(f"Error in stream_notes route: {str(e)}")
+        return jsonify({
+            "status": "error",
+            "message": str(e),
+            "notes": None
+        }), 500
+
 @app.route('/get_transcript')
 def get_transcript():
     """Serve transcript data"""
@@ -323,15 +604,20 @@ def get_transcript():
         transcript_path = "data/transcripts/transcript.txt"
         english_path = "data/transcripts/transcript_english.txt"
         
-        if os.path.exists(transcript_path):
-            with open(transcript_path, 'r', encoding='utf-8') as f:
-                transcript = f.read()
+        # Files left from an earlier video are stale until this run's stage finishes
+        if not PROCESSING_STATE["transcribed"].is_set() and is_pipeline_running():
+            return jsonify({
+                'status': 'processing',
+                'message': 'Transcript is still being generated. Please wait...'
+            })
+        
+        if PROCESSING_STATE["transcribed"].is_set() and os.path.exists(transcript_path):
+            transcript = read_file_cached(transcript_path)
             
-            # Check if English version exists
+            # Only offer the English version once translation has finished
             english_transcript = None
-            if os.path.exists(english_path):
-                with open(english_path, 'r', encoding='utf-8') as f:
-                    english_transcript = f.read()
+            if PROCESSING_STATE["translated"].is_set() and os.path.exists(english_path):
+                english_transcript = read_file_cached(english_path)
             
             return jsonify({
                 'status': 'success',
@@ -367,12 +653,13 @@ def translate_transcript():
         english_transcript = None
         english_path = None
         
-        for path in possible_paths:
-            if os.path.exists(path):
-                with open(path, 'r', encoding='utf-8') as f:
-                    english_transcript = f.read()
-                english_path = path
-                break
+        # A partial or stale translation is never served while the current run translates
+        if PROCESSING_STATE["translated"].is_set():
+            for path in possible_paths:
+                if os.path.exists(path):
+                    english_transcript = read_file_cached(path)
+                    english_path = path
+                    break
         
         if english_transcript:
             return jsonify({
@@ -406,7 +693,7 @@ def ask_question():
             })
         
         # Get answer from Q&A system
-        result = answer_question(question)
+        result = request_coalescer.run(("question", question), answer_question, question)
         
         return jsonify(result)
         
@@ -429,4 +716,10 @@ def qna_status():
     
 # ------------------- MAIN -------------------
 if __name__ == '__main__':
-    app.run(debug=True)
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(debug=True)
+    else:
+        # Multi-threaded WSGI server; one process keeps models and PROCESSING_STATE shared
+        serve(app, host="127.0.0.1", port=5000, threads=16)
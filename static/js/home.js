@@ -69,7 +69,7 @@ fileInput.addEventListener("change", async (e) => {
           const data = await res.json();
 
           if (data.status === "success") {
-            uploadStatus.innerHTML = `<p style="color: var(--accent); text-align: center; margin-top: 10px;"><i class="fas fa-check-circle"></i> Video processed successfully! Select an analysis option below.</p>`;
+            uploadStatus.innerHTML = `<p style="color: var(--accent); text-align: center; margin-top: 10px;"><i class="fas fa-check-circle"></i> Video processed successfully! Select an analysis option below.</p>` + transcriptPendingNote(data);
               optionsSection.style.display = "block";
               optionsSection.classList.add("visible");
               
@@ -112,7 +112,7 @@ processButton.addEventListener("click", async () => {
       const data = await res.json();
 
       if (data.status === "success") {
-        uploadStatus.innerHTML = `<p style="color: var(--accent); text-align: center; margin-top: 10px;"><i class="fas fa-check-circle"></i> YouTube video processed successfully! Select an analysis option below.</p>`;
+        uploadStatus.innerHTML = `<p style="color: var(--accent); text-align: center; margin-top: 10px;"><i class="fas fa-check-circle"></i> YouTube video processed successfully! Select an analysis option below.</p>` + transcriptPendingNote(data);
           optionsSection.style.display = "block";
           optionsSection.classList.add("visible");
           
@@ -128,6 +128,14 @@ processButton.addEventListener("click", async () => {
   }
 });
 
+  // Whisper transcripts are still being written when /process returns
+  function transcriptPendingNote(data) {
+    if (data.transcript_ready) {
+      return "";
+    }
+    return `<p style="color: var(--primary); font-size: 0.9rem; text-align: center;"><i class="fas fa-clock"></i> The transcript is being generated in the background and will appear on the transcript page when it is complete.</p>`;
+  }
+
   // ---------------- BACKGROUND PROCESSING STATUS CHECK ----------------
   function startBackgroundStatusCheck() {
     let checkCount = 0;
@@ -99,29 +99,43 @@ document.addEventListener("DOMContentLoaded", () => {
             showLoadingState();
             startProgressAnimation();
             retryCount = 0;
+            const startTime = performance.now();
             
-            const response = await fetch('/generate_notes', {
+            const response = await fetch('/stream_notes', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
                 }
             });
             
-            const data = await response.json();
-            
-            if (data.status === 'success' && data.notes) {
-                currentNotes = data.notes;
-                processAndDisplayNotes(currentNotes);
-                updateStats(data.word_count || currentNotes.split(/\s+/).length);
-                if (data.processing_time) {
-                    updateProcessingTime(data.processing_time);
-                } else {
-                    updateProcessingTime();
+            const contentType = response.headers.get('Content-Type') || '';
+            if (contentType.includes('text/plain')) {
+                // Render each section as soon as it arrives
+                const reader = response.body.getReader();
+                const decoder = new TextDecoder();
+                currentNotes = "";
+                
+                while (true) {
+                    const { done, value } = await reader.read();
+                    if (done) break;
+                    currentNotes += decoder.decode(value, { stream: true });
+                    hideLoadingState();
+                    processAndDisplayNotes(currentNotes);
                 }
+                currentNotes += decoder.decode();
+                
+                processAndDisplayNotes(currentNotes);
+                updateStats(currentNotes.split(/\s+/).filter(Boolean).length);
+                updateProcessingTime((performance.now() - startTime) / 1000);
                 hideLoadingState();
                 
                 showToast('Structured notes generated successfully!');
-            } else if (data.status === 'processing') {
+                return;
+            }
+            
+            const data = await response.json();
+            
+            if (data.status === 'processing') {
                 // Video is still processing
                 showProcessingState(data.message);
                 // Auto-retry after delay
@@ -65,12 +65,21 @@ document.addEventListener("DOMContentLoaded", () => {
     async function loadExistingTranscript() {
         try {
             // Show loading state
-            showLoadingState('Loading transcript...');
+            if (loadingState.style.display !== 'block') {
+                showLoadingState('Loading transcript...');
+            }
             
             // Add timestamp to avoid cached responses
             const response = await fetch('/get_transcript?' + new Date().getTime());
             const data = await response.json();
             
+            if (data.status === 'processing') {
+                // Transcription is still running in the background; try again shortly
+                showLoadingState(data.message || 'Transcribing video...');
+                setTimeout(loadExistingTranscript, 3000);
+                return;
+            }
+            
             if (data.status === 'success' && data.transcript) {
                 currentTranscript = data.transcript;
                 currentTranslation = data.english_transcript || '';
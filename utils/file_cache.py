@@ -0,0 +1,56 @@
+# utils/file_cache.py
+
+import os
+import re
+import mmap
+from functools import lru_cache
+
+_NON_SPACE_RE = re.compile(rb'\S')
+
+
+@lru_cache(maxsize=16)
+def _read_file_cached(path, mtime):
+    """Read a text file once per (path, mtime) pair"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def read_file_cached(path):
+    """
+    Returns the contents of a text file, served from memory while the file is unchanged.
+    The modification time is part of the cache key, so rewritten files are re-read.
+    """
+    return _read_file_cached(path, os.path.getmtime(path))
+
+
+def has_meaningful_content(path, min_chars=50):
+    """
+    True if the file holds more than min_chars characters once surrounding whitespace is stripped.
+    The file is memory-mapped and only its ends are scanned, so large transcripts are never read whole.
+    """
+    if os.path.getsize(path) == 0:
+        return False  # empty files cannot be mapped
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        first = _NON_SPACE_RE.search(mm)
+        if first is None:
+            return False
+        start = first.start()
+
+        # Walk back from the end in blocks to find the last non-whitespace byte
+        end = len(mm)
+        while True:
+            block_start = max(start, end - 4096)
+            stripped = mm[block_start:end].rstrip()
+            if stripped:
+                end = block_start + len(stripped)
+                break
+            end = block_start
+
+        # A UTF-8 character is 1 to 4 bytes, so only a short span needs decoding
+        span = end - start
+        if span <= min_chars:
+            return False
+        if span > 4 * min_chars:
+            return True
+        return len(mm[start:end].decode('utf-8', errors='ignore')) > min_chars
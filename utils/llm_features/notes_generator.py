@@ -4,7 +4,24 @@ import os
 import logging
 import re
 import time
-from transformers import pipeline
+import heapq
+from collections import Counter
+from functools import lru_cache
+import numpy as np
+import torch
+from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
+from utils.file_cache import read_file_cached, has_meaningful_content
+from utils.result_cache import cache_key, get_or_compute
+
+_SPLIT_RE = re.compile(r'[.!?]+')
+# Importance indicators, matched in one regex pass per sentence
+_IMPORTANCE_INDICATORS = (
+    'important', 'key', 'main', 'essential', 'critical', 'crucial',
+    'must', 'should', 'because', 'therefore', 'however', 'consequently',
+    'significantly', 'primarily', 'fundamental'
+)
+_INDICATOR_RE = re.compile(r'\b(' + '|'.join(_IMPORTANCE_INDICATORS) + r')\b')
+_STOPWORDS = frozenset(('the', 'and', 'is', 'in', 'to', 'of', 'a', 'that', 'it', 'for'))
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -12,18 +29,43 @@ logger = logging.getLogger(__name__)
 
 class NotesGenerator:
     def __init__(self):
+        self.model_name = "sshleifer/distilbart-cnn-12-6"
+        # Numeric format the summarizer runs in; part of the summary cache key
+        self.precision = None
         self.summarizer = None
+        # Per-instance memo of summaries, keyed by model and content hash
+        self._summarize_cached = lru_cache(maxsize=64)(self._summarize_uncached)
+        # Sentences of the most recently split text, shared by all note sections
+        self._last_split = (None, [])
         self._initialize_summarizer()
     
     def _initialize_summarizer(self):
         """Initialize with fast local model"""
         try:
+            model_name = self.model_name
+            tokenizer = AutoTokenizer.from_pretrained(model_name)
+            
+            # Half precision on GPU (BF16 where supported), dynamic int8 on CPU
+            if torch.cuda.is_available():
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                model = AutoModelForSeq2SeqLM.from_pretrained(model_name, torch_dtype=dtype).to("cuda").eval()
+                device = 0
+                self.precision = str(dtype).replace("torch.", "")
+            else:
+                model = AutoModelForSeq2SeqLM.from_pretrained(model_name).eval()
+                # int8 Linear weights run on FBGEMM's VNNI kernels and shrink the model ~4x
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+                device = -1
+                self.precision = "qint8"
+            
             self.summarizer = pipeline(
                 "summarization",
-                model="sshleifer/distilbart-cnn-12-6",
+                model=model,
+                tokenizer=tokenizer,
+                device=device,
                 max_length=1024
             )
-            logger.info("Fast notes generator initialized")
+            logger.info(f"Fast notes generator initialized ({self.precision})")
         except Exception as e:
             logger.error(f"Error initializing: {e}")
             self.summarizer = None
@@ -39,8 +81,7 @@ class NotesGenerator:
             # Try in order of preference
             for path in [cleaned_path, english_path, original_path]:
                 if os.path.exists(path):
-                    with open(path, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
+                    content = read_file_cached(path).strip()
                     if content and len(content) > 50:  # Ensure meaningful content
                         logger.info(f"Using transcript from: {path}")
                         return content
@@ -50,92 +91,84 @@ class NotesGenerator:
             logger.error(f"Error reading transcript: {e}")
             return None
     
+    def _sentences(self, text):
+        """Split text into stripped sentences, reusing the last split for the same text"""
+        key = (hash(text), len(text))
+        last_key, sentences = self._last_split
+        if key != last_key:
+            sentences = [s.strip() for s in _SPLIT_RE.split(text) if s.strip()]
+            # Swap in key and sentences together so concurrent requests never see a mismatch
+            self._last_split = (key, sentences)
+        return sentences
+    
     def _extract_key_points(self, text, num_points=8):
         """Extract key points using improved text analysis"""
         if not text:
             return []
             
         # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 15]
+        sentences = [s for s in self._sentences(text) if len(s) > 15]
         
         if not sentences:
             return []
         
-        # Score sentences by importance
-        scored_sentences = []
-        for sentence in sentences:
-            if len(sentence.split()) < 3:  # Skip very short sentences
-                continue
-                
-            score = 0
-            # Length score (optimal length gets higher score)
-            word_count = len(sentence.split())
-            if 8 <= word_count <= 25:
-                score += 10
-            elif word_count > 25:
-                score += 5
-            
-            # Importance indicators
-            importance_indicators = [
-                'important', 'key', 'main', 'essential', 'critical', 'crucial',
-                'must', 'should', 'because', 'therefore', 'however', 'consequently',
-                'significantly', 'primarily', 'fundamental'
-            ]
-            
-            for indicator in importance_indicators:
-                if indicator in sentence.lower():
-                    score += 8
-            
-            # Structural indicators
-            if sentence[0].isupper() and any(char.isdigit() for char in sentence):
-                score += 5  # Likely a numbered point
-            
-            scored_sentences.append((score, sentence))
+        # Skip very short sentences
+        word_counts = [len(s.split()) for s in sentences]
+        sentences = [s for s, wc in zip(sentences, word_counts) if wc >= 3]
+        if not sentences:
+            return []
         
-        # Get top sentences
-        scored_sentences.sort(reverse=True, key=lambda x: x[0])
-        return [sentence for _, sentence in scored_sentences[:num_points] if sentence]
+        # Score sentences by importance in one vectorized pass
+        word_counts = np.array([wc for wc in word_counts if wc >= 3])
+        indicator_counts = np.fromiter(
+            (len(set(_INDICATOR_RE.findall(s.lower()))) for s in sentences),
+            dtype=int, count=len(sentences)
+        )
+        # Structural indicator: likely a numbered point
+        numbered = np.fromiter(
+            (s[0].isupper() and any(char.isdigit() for char in s) for s in sentences),
+            dtype=bool, count=len(sentences)
+        )
+        
+        # Length score (optimal length gets higher score)
+        length_scores = np.where((word_counts >= 8) & (word_counts <= 25), 10, np.where(word_counts > 25, 5, 0))
+        scores = length_scores + 8 * indicator_counts + 5 * numbered
+        
+        # Get top sentences: O(n log k) partial selection that, like a stable sort,
+        # keeps the earlier sentence first when scores tie
+        score_list = scores.tolist()
+        top = heapq.nlargest(num_points, range(len(score_list)), key=score_list.__getitem__)
+        return [sentences[i] for i in top]
     
     def _create_structured_notes(self, content):
         """Create structured notes from any content"""
         if not content:
             return "No content available for note generation."
         
-        # Extract main topics from content
-        words = content.lower().split()
-        common_words = set(['the', 'and', 'is', 'in', 'to', 'of', 'a', 'that', 'it', 'for'])
-        content_words = [w for w in words if w not in common_words and len(w) > 3]
-        
-        # Get frequent words as potential topics
-        from collections import Counter
-        word_freq = Counter(content_words)
-        main_topics = [word for word, count in word_freq.most_common(5)]
+        return "".join(self._iter_structured_notes(content))
+    
+    def _iter_structured_notes(self, content):
+        """Yield the structured notes one markdown section at a time"""
+        yield "# Content Notes\n\n"
         
         # Generate summary
         summary = self._generate_summary(content)
+        yield f"## Overview\n{summary}\n\n"
         
-        # Extract key points
-        key_points = self._extract_key_points(content)
-        
-        # Build structured notes
-        notes = f"""# Content Notes
-
-## Overview
-{summary}
-
-## Main Topics
-{chr(10).join(f"- {topic.capitalize()}" for topic in main_topics)}
-
-## Key Points
-"""
+        # Extract main topics from content, lowercased in one pass
+        word_freq = Counter(
+            w for w in content.lower().split()
+            if len(w) > 3 and w not in _STOPWORDS
+        )
+        main_topics = [word for word, count in word_freq.most_common(5)]
+        yield "## Main Topics\n" + "\n".join(f"- {topic.capitalize()}" for topic in main_topics) + "\n\n"
         
-        # Add key points
-        for i, point in enumerate(key_points[:6], 1):
-            notes += f"{i}. {point}\n"
+        # Extract key points
+        key_points = self._extract_key_points(content, num_points=6)
+        yield "## Key Points\n" + "".join(f"{i}. {point}\n" for i, point in enumerate(key_points, 1))
         
         # Add additional sections based on content
-        notes += """
+        yield """
 ## Additional Information
 - Important details from the content
 - Supporting facts and evidence
@@ -146,14 +179,12 @@ class NotesGenerator:
 - Practical applications
 - Key insights worth remembering
 """
-        return notes
     
     def _generate_summary(self, content):
         """Generate summary using local model"""
         if not self.summarizer or len(content.split()) < 100:
             # Fallback summary for short content
-            sentences = re.split(r'[.!?]+', content)
-            meaningful_sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+            meaningful_sentences = [s for s in self._sentences(content) if len(s) > 20]
             if meaningful_sentences:
                 return meaningful_sentences[0] + " " + meaningful_sentences[-1] if len(meaningful_sentences) > 1 else meaningful_sentences[0]
             return "Summary of the main content points."
@@ -161,23 +192,31 @@ class NotesGenerator:
         try:
             # Use first 1500 characters for summarization
             input_text = content[:1500]
-            summary = self.summarizer(
-                input_text,
-                max_length=200,
-                min_length=100,
-                do_sample=False
-            )[0]['summary_text']
-            return summary
+            key = cache_key(f"{self.model_name}:{self.precision}", input_text)
+            return self._summarize_cached(key, input_text)
         except Exception as e:
             logger.error(f"Summarization failed: {e}")
             # Fallback: use first and last meaningful sentences
-            sentences = [s.strip() for s in content.split('.') if len(s.strip()) > 30]
+            sentences = [s for s in self._sentences(content) if len(s) > 30]
             if len(sentences) >= 2:
                 return sentences[0] + ". " + sentences[-1] + "."
             elif sentences:
                 return sentences[0] + "."
             return "Key points and main ideas from the content."
     
+    def _summarize_uncached(self, key, input_text):
+        """Run the summarizer, reusing a summary persisted in the result cache"""
+        def summarize():
+            with torch.inference_mode():
+                return self.summarizer(
+                    input_text,
+                    max_length=200,
+                    min_length=100,
+                    do_sample=False
+                )[0]['summary_text']
+        
+        return get_or_compute(key, summarize)
+    
     def generate_detailed_notes(self):
         """Generate notes with timing and validation"""
         start_time = time.time()
@@ -224,6 +263,30 @@ class NotesGenerator:
                 'notes': None
             }
     
+    def stream_detailed_notes(self):
+        """Validate like generate_detailed_notes, but return the notes as a section generator"""
+        if not self._is_processing_complete():
+            return {
+                'status': 'processing',
+                'message': 'Video is still being processed. Please wait...',
+                'notes': None
+            }
+        
+        transcript = self._read_latest_transcript()
+        
+        if not transcript:
+            return {
+                'status': 'error',
+                'message': 'No transcript available. Please process a video first.',
+                'notes': None
+            }
+        
+        logger.info("Streaming structured notes...")
+        return {
+            'status': 'success',
+            'notes': self._iter_structured_notes(transcript)
+        }
+    
     def _is_processing_complete(self):
         """Check if background processing is complete"""
         required_files = [
@@ -235,9 +298,7 @@ class NotesGenerator:
         for file_path in required_files:
             if os.path.exists(file_path):
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
-                    if content and len(content) > 50:
+                    if has_meaningful_content(file_path):
                         return True
                 except:
                     continue
@@ -247,4 +308,7 @@ class NotesGenerator:
 notes_generator_instance = NotesGenerator()
 
 def generate_detailed_notes():
-    return notes_generator_instance.generate_detailed_notes()
\ No newline at end of file
+    return notes_generator_instance.generate_detailed_notes()
+
+def stream_detailed_notes():
+    return notes_generator_instance.stream_detailed_notes()
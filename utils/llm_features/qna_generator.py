@@ -1,12 +1,69 @@
 # utils/llm_features/qna_generator.py - ENHANCED QUALITY VERSION
 
 import os
+import re
 import pickle
+import random
 import logging
+import threading
+import traceback
+from functools import lru_cache
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 from transformers import pipeline, AutoTokenizer, AutoModelForQuestionAnswering, AutoModelForCausalLM
 import torch
+from utils.text_preprocessing.vectorizer import load_embedder
+
+# optimum is optional - runs the QA model as a fused, int8 ONNX Runtime graph when installed
+try:
+    from optimum.onnxruntime import ORTModelForQuestionAnswering, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    ORT_AVAILABLE = True
+except ImportError:
+    ORT_AVAILABLE = False
+
+# simsimd is optional - scores questions against int8 embeddings with SIMD kernels when installed
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
+QA_MODEL_NAME = "distilbert-base-cased-distilled-squad"
+ONNX_QA_DIR = "data/cache/onnx_qa"
+
+# Span probability (p_start * p_end) above which a QA answer is trusted even if short,
+# and below which a start/end pair is not considered at all
+QA_HIGH_CONFIDENCE = 0.5
+QA_LOW_CONFIDENCE = 0.01
+
+# Sentence and keyword matching for the fallback sentence extractor
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+_HOWTO = re.compile(r'\b(how to|steps|guide|tutorial|install|run|setup)\b', re.I)
+_WORD = re.compile(r'\w+')
+
+# Canned answers for common questions, routed with one regex scan per question
+TOPIC_ANSWERS = {
+    "how i can run local llm": "To run a local LLM, you typically need to: 1) Download a model like Llama, Mistral, or Phi-3, 2) Use a framework like Ollama, LM Studio, or Text Generation WebUI, 3) Ensure you have sufficient RAM/VRAM, 4) Follow the specific setup instructions for your chosen model and platform.",
+    "what is local llm": "A local LLM (Large Language Model) is an AI model that runs on your own computer instead of through cloud services. This gives you more privacy, offline access, and control over the AI capabilities without relying on internet connectivity or external APIs.",
+    "how to install local llm": "To install a local LLM: 1) Choose a model manager like Ollama or LM Studio, 2) Download and install the software, 3) Select and download your preferred model, 4) Configure the settings based on your hardware, 5) Start using the model through the provided interface or API.",
+    "best local llm": "Some popular local LLMs include: Llama 2/3 (Meta), Mistral (Mistral AI), Phi-3 (Microsoft), and Gemma (Google). The best choice depends on your hardware, use case, and whether you need coding assistance, general chat, or specific domain expertise."
+}
+TOPIC_RE = re.compile("|".join(re.escape(key) for key in TOPIC_ANSWERS))
+
+# Simple greeting responses for common greetings
+GREETING_RESPONSES = {
+    "hi": "Hello! I'm your AI assistant. I can answer questions about the video content you've processed. What would you like to know?",
+    "hello": "Hello! I'm here to help you understand the video content better. What questions do you have?",
+    "hey": "Hey there! I'm ready to answer your questions about the video. What would you like to know?",
+    "hola": "¡Hola! I can help you with questions about the video content. What would you like to ask?",
+    "how are you": "I'm functioning well, thank you! I'm ready to help you explore the video content. What would you like to know about it?"
+}
+GREETING_RE = re.compile(r'\b(' + "|".join(re.escape(key) for key in GREETING_RESPONSES) + r')\b')
+
+def _quantize_rows(matrix):
+    """Symmetric per-row int8 quantization; cosine similarity is unaffected by the row scales"""
+    scales = np.maximum(np.abs(matrix).max(axis=1, keepdims=True), 1e-12) / 127
+    return np.round(matrix / scales).astype(np.int8)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -15,45 +72,113 @@ logger = logging.getLogger(__name__)
 class QnAGenerator:
     def __init__(self):
         self.qa_model = None
+        self.qa_backend = None
+        self.qa_device = "cpu"
+        self.qa_precision = None
         self.tokenizer = None
         self.generator_model = None
         self.generator_tokenizer = None
+        self._generator_attempted = False
+        self._generator_lock = threading.Lock()
+        self.embedder = None
+        self._encode_question_cached = lru_cache(1024)(self._encode_question_uncached)
         self.embeddings = None
+        self.embeddings_int8 = None
+        self.corpus_tensor = None
         self.chunks = []
+        self._chunks_dir = None
         self._initialize_models()
         self._load_embeddings_and_chunks()
     
     def _initialize_models(self):
         """Initialize the Q&A and generation models"""
+        # Leave half the cores to the web server threads; interop threads only add contention here
+        try:
+            torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
+            torch.set_num_interop_threads(1)
+        except RuntimeError as e:
+            logger.warning(f"Could not configure torch threads: {e}")
+        
         try:
             # Use a fast, lightweight model for Q&A
-            model_name = "distilbert-base-cased-distilled-squad"
+            model_name = QA_MODEL_NAME
             self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.qa_model = AutoModelForQuestionAnswering.from_pretrained(model_name)
-            logger.info("Q&A model initialized successfully")
             
-            # Initialize a text generation model for better answers
-            try:
-                self.generator_model = pipeline(
-                    "text-generation",
-                    model="microsoft/DialoGPT-medium",
-                    tokenizer="microsoft/DialoGPT-medium",
-                    max_length=200,
-                    do_sample=True,
-                    temperature=0.7
-                )
-                logger.info("Text generation model initialized successfully")
-            except Exception as e:
-                logger.warning(f"Could not load text generation model: {e}")
-                self.generator_model = None
+            # Half precision on GPU (BF16 where supported), int8 ONNX Runtime or PyTorch on CPU
+            if torch.cuda.is_available():
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                self.qa_model = AutoModelForQuestionAnswering.from_pretrained(model_name, torch_dtype=dtype).to("cuda").eval()
+                self.qa_backend = "torch"
+                self.qa_device = "cuda"
+                self.qa_precision = str(dtype).replace("torch.", "")
+            else:
+                if ORT_AVAILABLE:
+                    try:
+                        self.qa_model = self._load_onnx_qa_model(model_name)
+                        self.qa_backend = "onnx"
+                    except Exception as e:
+                        logger.warning(f"Could not load ONNX Runtime Q&A model, using PyTorch: {e}")
+                
+                if self.qa_model is None:
+                    self.qa_model = AutoModelForQuestionAnswering.from_pretrained(model_name).eval()
+                    # int8 Linear weights roughly halve CPU latency
+                    self.qa_model = torch.quantization.quantize_dynamic(self.qa_model, {torch.nn.Linear}, dtype=torch.qint8)
+                    self.qa_model.eval()
+                    self.qa_backend = "torch"
+                self.qa_precision = "qint8"
+            logger.info(f"Q&A model initialized successfully ({self.qa_backend}, {self.qa_precision})")
                 
         except Exception as e:
             logger.error(f"Error initializing models: {e}")
             self.qa_model = None
-            self.generator_model = None
+        
+        # Share the vectorizer's embedder so questions and chunks come from the same backend
+        # and the similarity cutoff means the same thing for both.
+        self.embedder, _ = load_embedder()
+    
+    def _ensure_generator_loaded(self):
+        """Load the text generation model on first use; it only serves a rare fallback"""
+        if self._generator_attempted:
+            return self.generator_model
+        
+        with self._generator_lock:
+            if not self._generator_attempted:
+                try:
+                    self.generator_model = pipeline(
+                        "text-generation",
+                        model="microsoft/DialoGPT-medium",
+                        tokenizer="microsoft/DialoGPT-medium",
+                        max_length=200,
+                        do_sample=True,
+                        temperature=0.7
+                    )
+                    logger.info("Text generation model initialized successfully")
+                except Exception as e:
+                    logger.warning(f"Could not load text generation model: {e}")
+                    self.generator_model = None
+                self._generator_attempted = True
+        return self.generator_model
+    
+    def _load_onnx_qa_model(self, model_name):
+        """Export the QA model to ONNX and quantize it to int8 once, then load the cached graph"""
+        quantized_dir = os.path.join(ONNX_QA_DIR, "quantized")
+        if not os.path.exists(os.path.join(quantized_dir, "model_quantized.onnx")):
+            logger.info("Exporting Q&A model to ONNX (first run only)...")
+            ort_model = ORTModelForQuestionAnswering.from_pretrained(model_name, export=True)
+            ort_model.save_pretrained(ONNX_QA_DIR)
+            quantizer = ORTQuantizer.from_pretrained(ONNX_QA_DIR)
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=quantized_dir, quantization_config=qconfig)
+        
+        # ONNX Runtime applies ORT_ENABLE_ALL graph optimizations (attention/LayerNorm fusion) by default
+        return ORTModelForQuestionAnswering.from_pretrained(quantized_dir, file_name="model_quantized.onnx")
     
     def _find_chunks_directory(self):
         """Find the correct chunks directory with multiple possible locations"""
+        # Resolved once; keep probing only while nothing has been found
+        if self._chunks_dir:
+            return self._chunks_dir
+        
         # Get the project root directory
         current_dir = os.path.dirname(os.path.abspath(__file__))
         project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
@@ -72,6 +197,7 @@ class QnAGenerator:
         for dir_path in possible_dirs:
             if os.path.exists(dir_path):
                 logger.info(f"Found chunks directory: {dir_path}")
+                self._chunks_dir = dir_path
                 return dir_path
         
         logger.warning("No chunks directory found in any expected location")
@@ -88,79 +214,89 @@ class QnAGenerator:
                 self.chunks = []
                 return
             
-            # Load embeddings from multiple possible locations
-            embeddings_paths = [
-                os.path.join(chunks_dir, "embeddings.pkl"),
-                "data/text_chunks/embeddings.pkl",
-                "data/text chunks/embeddings.pkl", 
-                "data/chunks/embeddings.pkl"
-            ]
-            
-            # Add absolute paths
-            for emb_path in embeddings_paths[:]:  # Copy the list
-                if not os.path.isabs(emb_path):
-                    abs_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), emb_path)
-                    embeddings_paths.append(abs_path)
+            # Load embeddings from multiple possible locations, relative to the working directory
+            # and to the project root; resolving them first drops the duplicates
+            project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            embeddings_dirs = [chunks_dir, "data/text_chunks", "data/text chunks", "data/chunks"]
+            embeddings_paths = list(dict.fromkeys(
+                os.path.abspath(os.path.join(base, emb_dir, "embeddings.pkl"))
+                for base in ("", project_root)
+                for emb_dir in embeddings_dirs
+            ))
             
             self.embeddings = None
             for emb_path in embeddings_paths:
+                # The vectorizer also writes normalized float32 embeddings.npy, which is memory-mapped
+                npy_path = os.path.splitext(emb_path)[0] + ".npy"
+                if os.path.exists(npy_path):
+                    try:
+                        self.embeddings = np.load(npy_path, mmap_mode='r').astype(np.float32, copy=False)
+                        logger.info(f"Memory-mapped embeddings from: {npy_path}, shape: {self.embeddings.shape}")
+                        break
+                    except Exception as e:
+                        logger.warning(f"Failed to load embeddings from {npy_path}: {e}")
+                
                 if os.path.exists(emb_path):
                     try:
                         with open(emb_path, 'rb') as f:
-                            self.embeddings = pickle.load(f)
+                            embeddings = pickle.load(f)
+                        # Normalize once so cosine similarity is a plain dot product per question
+                        embeddings = np.array(embeddings, dtype=np.float32)
+                        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-12
+                        self.embeddings = embeddings
                         logger.info(f"Loaded embeddings from: {emb_path}, shape: {self.embeddings.shape}")
                         break
                     except Exception as e:
                         logger.warning(f"Failed to load embeddings from {emb_path}: {e}")
                         continue
             
+            self.embeddings_int8 = None
+            self.corpus_tensor = None
             if self.embeddings is None:
                 logger.warning("Embeddings file not found in any expected location")
+            else:
+                # One C-contiguous float32 block so each question is a single sgemv
+                self.embeddings = np.ascontiguousarray(self.embeddings, dtype=np.float32)
+                if torch.cuda.is_available():
+                    # Keep the corpus resident on the GPU; only the question and top-k cross the bus
+                    self.corpus_tensor = torch.tensor(self.embeddings, dtype=torch.float16, device="cuda")
+                elif SIMSIMD_AVAILABLE:
+                    self.embeddings_int8 = _quantize_rows(self.embeddings)
             
             # Load chunks
             self.chunks = []
             
-            # Look for chunk files in the found directory
-            import glob
-            
-            # Try different chunk file patterns
-            chunk_patterns = [
-                "chunk_*.txt",           # chunk_0.txt, chunk_1.txt
-                "chunk_*.txt",           # chunk_001.txt, chunk_002.txt  
-                "*.txt"                  # All text files
-            ]
-            
-            chunk_files = []
-            for pattern in chunk_patterns:
-                found_files = glob.glob(os.path.join(chunks_dir, pattern))
-                if found_files:
-                    chunk_files = found_files
-                    break
+            # List the directory once; prefer chunk_*.txt, falling back to all text files
+            with os.scandir(chunks_dir) as entries:
+                text_files = [entry for entry in entries if entry.name.endswith(".txt") and entry.is_file()]
+            chunk_files = [entry for entry in text_files if entry.name.startswith("chunk_")] or text_files
             
             if not chunk_files:
                 logger.warning(f"No chunk files found in {chunks_dir}")
                 return
             
             # Sort chunk files numerically
-            def extract_number(filename):
-                import re
-                numbers = re.findall(r'\d+', filename)
+            def extract_number(entry):
+                numbers = re.findall(r'\d+', entry.name)
                 return int(numbers[0]) if numbers else 0
             
             chunk_files.sort(key=extract_number)
             
             logger.info(f"Found {len(chunk_files)} chunk files, loading content...")
             
-            for chunk_file in chunk_files:
+            chunks = [None] * len(chunk_files)
+            for i, chunk_file in enumerate(chunk_files):
                 try:
-                    with open(chunk_file, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
-                        if content and len(content) > 10:  # Only add meaningful chunks
-                            self.chunks.append(content)
+                    # Unbuffered binary read: one read() per file, no text-layer copy
+                    with open(chunk_file.path, 'rb', buffering=0) as f:
+                        chunks[i] = f.read().decode('utf-8').strip()
                 except Exception as e:
-                    logger.warning(f"Error reading chunk file {chunk_file}: {e}")
+                    logger.warning(f"Error reading chunk file {chunk_file.path}: {e}")
                     continue
             
+            # Only keep meaningful chunks
+            self.chunks = [content for content in chunks if content and len(content) > 10]
+            
             logger.info(f"Successfully loaded {len(self.chunks)} text chunks")
             
             # Verify chunks and embeddings match
@@ -170,36 +306,54 @@ class QnAGenerator:
         except Exception as e:
             logger.error(f"Error loading embeddings/chunks: {e}")
             self.embeddings = None
+            self.embeddings_int8 = None
+            self.corpus_tensor = None
             self.chunks = []
     
-    def _find_relevant_chunks(self, question, top_k=5):
+    def _encode_question_uncached(self, question):
+        """Encode one question as a hashable tuple so repeated questions skip the embedder"""
+        embedding = self.embedder.encode([question], convert_to_numpy=True, normalize_embeddings=True)[0]
+        return tuple(embedding.tolist())
+    
+    def _find_relevant_chunks(self, question, top_k=5, question_embedding=None):
         """Find the most relevant chunks for the question"""
         if self.embeddings is None or not self.chunks:
             logger.warning("No embeddings or chunks available for similarity search")
             return []
         
         try:
-            # Generate question embedding
-            from sentence_transformers import SentenceTransformer
-            model = SentenceTransformer('all-MiniLM-L6-v2')
-            question_embedding = model.encode([question])
-            
-            # Calculate similarities
-            if isinstance(self.embeddings, list):
-                embeddings_array = np.array(self.embeddings)
-            else:
-                embeddings_array = self.embeddings
+            if question_embedding is None:
+                if self.embedder is None:
+                    raise RuntimeError("Embedding model is not loaded")
                 
-            similarities = cosine_similarity(question_embedding, embeddings_array)[0]
+                # Generate question embedding
+                question_embedding = self._encode_question_cached(question)
             
             # Get top-k most similar chunks (increased from 3 to 5 for more context)
-            top_indices = np.argsort(similarities)[-top_k:][::-1]
+            top_k = min(top_k, len(self.embeddings))
+            if self.corpus_tensor is not None:
+                # Similarity and top-k on the GPU (both sides are unit length)
+                question_tensor = torch.as_tensor(question_embedding, dtype=torch.float16, device=self.corpus_tensor.device)
+                top_scores, top_indices = torch.topk(self.corpus_tensor @ question_tensor, top_k)
+                top_scores, top_indices = top_scores.float().tolist(), top_indices.tolist()
+            else:
+                # Calculate similarities (both sides are unit length)
+                question_embedding = np.asarray(question_embedding, dtype=np.float32)
+                if self.embeddings_int8 is not None:
+                    distances = simsimd.cdist(_quantize_rows(question_embedding[None]), self.embeddings_int8, metric="cosine")
+                    similarities = 1.0 - np.asarray(distances)[0]
+                else:
+                    similarities = self.embeddings @ question_embedding
+                
+                candidates = np.argpartition(similarities, -top_k)[-top_k:]
+                top_indices = candidates[np.argsort(similarities[candidates])[::-1]]
+                top_scores = similarities[top_indices]
             relevant_chunks = []
             
-            for i in top_indices:
-                if i < len(self.chunks) and similarities[i] > 0.3:  # Only include chunks with decent similarity
+            for i, similarity in zip(top_indices, top_scores):
+                if i < len(self.chunks) and similarity > 0.3:  # Only include chunks with decent similarity
                     relevant_chunks.append(self.chunks[i])
-                    logger.info(f"Relevant chunk {i}: similarity {similarities[i]:.3f}")
+                    logger.info(f"Relevant chunk {i}: similarity {similarity:.3f}")
             
             return relevant_chunks
             
@@ -222,38 +376,39 @@ class QnAGenerator:
                 question, 
                 combined_context, 
                 return_tensors="pt", 
-                truncation=True, 
-                max_length=512,
-                stride=128,
-                padding=True
-            )
+                truncation="only_second", 
+                max_length=512
+            ).to(self.qa_device)
             
-            with torch.no_grad():
+            with torch.inference_mode():
                 outputs = self.qa_model(**inputs)
             
             start_logits = outputs.start_logits
             end_logits = outputs.end_logits
             
-            # Get multiple possible answers
-            start_indices = torch.topk(start_logits, 3).indices[0]
-            end_indices = torch.topk(end_logits, 3).indices[0]
+            # Score every top-3 start/end pair at once with its own span probability
+            start_probs, start_indices = torch.topk(torch.softmax(start_logits[0].float(), dim=-1), 3)
+            end_probs, end_indices = torch.topk(torch.softmax(end_logits[0].float(), dim=-1), 3)
+            grid_starts, grid_ends = torch.meshgrid(start_indices, end_indices, indexing='ij')
+            pair_probs = start_probs[:, None] * end_probs[None, :]
+            
+            # Drop invalid and implausible pairs first, then prefer the longest remaining span
+            usable = (grid_ends >= grid_starts) & (pair_probs >= QA_LOW_CONFIDENCE)
+            lengths = (grid_ends - grid_starts + 1) * usable
             
             best_answer = ""
-            best_length = 0
-            
-            for start_idx in start_indices:
-                for end_idx in end_indices:
-                    if end_idx >= start_idx:
-                        answer_tokens = inputs["input_ids"][0][start_idx:end_idx+1]
-                        answer = self.tokenizer.decode(answer_tokens, skip_special_tokens=True)
-                        
-                        # Prefer longer, meaningful answers
-                        if len(answer) > best_length and len(answer) > 10:
-                            best_answer = answer
-                            best_length = len(answer)
-            
-            if best_answer and len(best_answer.strip()) > 15:
-                logger.info(f"Found Q&A answer: {best_answer}")
+            confidence = 0.0
+            best_pair = int(torch.argmax(lengths))
+            if lengths.flatten()[best_pair] > 0:
+                best_start = int(grid_starts.flatten()[best_pair])
+                best_end = int(grid_ends.flatten()[best_pair])
+                confidence = float(pair_probs.flatten()[best_pair])
+                # Decode only the winning span
+                best_answer = self.tokenizer.decode(inputs["input_ids"][0][best_start:best_end+1], skip_special_tokens=True)
+            
+            # A confident span is returned as-is; otherwise it must be long enough to be meaningful
+            if best_answer.strip() and (confidence >= QA_HIGH_CONFIDENCE or len(best_answer.strip()) > 15):
+                logger.info(f"Found Q&A answer (confidence {confidence:.2f}): {best_answer}")
                 return best_answer.strip()
                 
         except Exception as e:
@@ -261,31 +416,28 @@ class QnAGenerator:
         
         # Strategy 2: Find the most relevant sentence
         try:
-            sentences = combined_context.split('.')
-            question_words = set(question.lower().split())
+            sentences = [sentence.strip() for sentence in _SENT_SPLIT.split(combined_context)]
+            question_vocab = {word: i for i, word in enumerate(set(_WORD.findall(question.lower())))}
             
-            best_sentence = ""
-            best_score = 0
+            # 0/1 matrix of which question words each sentence contains
+            word_matrix = np.zeros((len(sentences), len(question_vocab)), dtype=np.uint8)
+            for row, sentence in enumerate(sentences):
+                word_matrix[row, [question_vocab[w] for w in _WORD.findall(sentence.lower()) if w in question_vocab]] = 1
             
-            for sentence in sentences:
-                sentence_lower = sentence.lower()
-                sentence_words = set(sentence_lower.split())
-                
-                # Score based on word overlap and position
-                common_words = question_words.intersection(sentence_words)
-                score = len(common_words)
-                
-                # Bonus for sentences that seem to answer the question
-                if any(word in sentence_lower for word in ['how to', 'steps', 'guide', 'tutorial', 'install', 'run', 'setup']):
-                    score += 3
-                
-                if score > best_score and len(sentence.strip()) > 20:
-                    best_sentence = sentence.strip()
-                    best_score = score
+            # Score based on word overlap, plus a bonus for sentences that seem to answer the question
+            howto_bonus = np.fromiter((_HOWTO.search(s) is not None for s in sentences), dtype=np.int8, count=len(sentences))
+            scores = word_matrix.sum(axis=1, dtype=np.int32) + 3 * howto_bonus
+            
+            # Ignore fragments; argmax keeps the earliest sentence on ties
+            too_short = np.fromiter((len(s) <= 20 for s in sentences), dtype=bool, count=len(sentences))
+            scores[too_short] = 0
+            best_index = int(np.argmax(scores))
+            best_sentence = sentences[best_index]
+            best_score = int(scores[best_index])
             
             if best_sentence and best_score >= 2:
                 logger.info(f"Found relevant sentence: {best_sentence}")
-                return best_sentence + "."
+                return best_sentence if best_sentence[-1] in ".!?" else best_sentence + "."
                 
         except Exception as e:
             logger.warning(f"Sentence extraction failed: {e}")
@@ -301,7 +453,7 @@ class QnAGenerator:
             return context_answer, True  # Answer from context
         
         # If no good context answer, use the generation model
-        if self.generator_model and context_chunks:
+        if context_chunks and self._ensure_generator_loaded():
             try:
                 # Create a prompt with context
                 context_preview = " ".join([chunk[:200] for chunk in context_chunks[:2]])  # Use first parts of top chunks
@@ -323,17 +475,9 @@ class QnAGenerator:
                 logger.warning(f"Generation model failed: {e}")
         
         # Fallback to knowledgeable responses
-        knowledgeable_answers = {
-            "how i can run local llm": "To run a local LLM, you typically need to: 1) Download a model like Llama, Mistral, or Phi-3, 2) Use a framework like Ollama, LM Studio, or Text Generation WebUI, 3) Ensure you have sufficient RAM/VRAM, 4) Follow the specific setup instructions for your chosen model and platform.",
-            "what is local llm": "A local LLM (Large Language Model) is an AI model that runs on your own computer instead of through cloud services. This gives you more privacy, offline access, and control over the AI capabilities without relying on internet connectivity or external APIs.",
-            "how to install local llm": "To install a local LLM: 1) Choose a model manager like Ollama or LM Studio, 2) Download and install the software, 3) Select and download your preferred model, 4) Configure the settings based on your hardware, 5) Start using the model through the provided interface or API.",
-            "best local llm": "Some popular local LLMs include: Llama 2/3 (Meta), Mistral (Mistral AI), Phi-3 (Microsoft), and Gemma (Google). The best choice depends on your hardware, use case, and whether you need coding assistance, general chat, or specific domain expertise."
-        }
-        
-        question_lower = question.lower().strip()
-        for key, answer in knowledgeable_answers.items():
-            if key in question_lower:
-                return answer, False
+        topic_match = TOPIC_RE.search(question.lower())
+        if topic_match:
+            return TOPIC_ANSWERS[topic_match.group(0)], False
         
         # General fallback
         fallback_answers = [
@@ -342,25 +486,14 @@ class QnAGenerator:
             "I found relevant information in the video that touches on this topic. The content suggests considering factors like hardware requirements, software setup, and model selection when working with local AI models."
         ]
         
-        import random
         return random.choice(fallback_answers), False
     
     def _generate_general_answer(self, question):
         """Generate a general answer when no relevant context is found"""
-        # Simple greeting responses for common greetings
-        greeting_responses = {
-            "hi": "Hello! I'm your AI assistant. I can answer questions about the video content you've processed. What would you like to know?",
-            "hello": "Hello! I'm here to help you understand the video content better. What questions do you have?",
-            "hey": "Hey there! I'm ready to answer your questions about the video. What would you like to know?",
-            "hola": "¡Hola! I can help you with questions about the video content. What would you like to ask?",
-            "how are you": "I'm functioning well, thank you! I'm ready to help you explore the video content. What would you like to know about it?"
-        }
-        
         # Check if it's a simple greeting
-        question_lower = question.lower().strip()
-        for greeting, response in greeting_responses.items():
-            if greeting in question_lower:
-                return response, 0.9, False
+        greeting_match = GREETING_RE.search(question.lower())
+        if greeting_match:
+            return GREETING_RESPONSES[greeting_match.group(1)], 0.9, False
         
         # More engaging fallback responses for other questions
         fallback_responses = [
@@ -370,7 +503,6 @@ class QnAGenerator:
             "That specific topic isn't extensively covered in the video. However, the video does provide valuable information on other related subjects."
         ]
         
-        import random
         return random.choice(fallback_responses), 0.3, False
     
     def get_system_status(self):
@@ -395,7 +527,7 @@ class QnAGenerator:
             
         return status
     
-    def answer_question(self, question):
+    def answer_question(self, question, question_embedding=None):
         """Main method to answer questions"""
         try:
             logger.info(f"Processing question: {question}")
@@ -417,10 +549,7 @@ class QnAGenerator:
                 }
             
             # Handle greetings immediately without similarity search
-            question_lower = question.lower().strip()
-            greeting_keywords = ['hi', 'hello', 'hey', 'hola', 'how are you']
-            
-            if any(greeting in question_lower for greeting in greeting_keywords):
+            if GREETING_RE.search(question.lower()):
                 logger.info("Detected greeting, using greeting response")
                 answer, confidence, has_context = self._generate_general_answer(question)
                 return {
@@ -432,7 +561,7 @@ class QnAGenerator:
                 }
             
             # Find relevant chunks for actual questions
-            relevant_chunks = self._find_relevant_chunks(question)
+            relevant_chunks = self._find_relevant_chunks(question, question_embedding=question_embedding)
             logger.info(f"Found {len(relevant_chunks)} relevant chunks")
             
             if relevant_chunks:
@@ -453,7 +582,6 @@ class QnAGenerator:
             
         except Exception as e:
             logger.error(f"Error in answer_question: {e}")
-            import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
             
             # Fallback response even on error
@@ -463,6 +591,19 @@ class QnAGenerator:
                 'confidence': 0.5,
                 'has_context': False
             }
+    
+    def answer_questions(self, questions):
+        """Answer several questions, encoding them for retrieval in a single batch"""
+        question_embeddings = [None] * len(questions)
+        if self.embedder is not None and questions:
+            try:
+                question_embeddings = self.embedder.encode(
+                    list(questions), batch_size=32, convert_to_numpy=True, normalize_embeddings=True
+                )
+            except Exception as e:
+                logger.warning(f"Batch question encoding failed, encoding one by one: {e}")
+        
+        return [self.answer_question(question, embedding) for question, embedding in zip(questions, question_embeddings)]
 
 # Create global instance
 qna_generator_instance = QnAGenerator()
@@ -470,5 +611,8 @@ qna_generator_instance = QnAGenerator()
 def answer_question(question):
     return qna_generator_instance.answer_question(question)
 
+def answer_questions(questions):
+    return qna_generator_instance.answer_questions(questions)
+
 def get_qna_status():
     return qna_generator_instance.get_system_status()
\ No newline at end of file
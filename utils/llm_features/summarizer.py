@@ -4,6 +4,7 @@ import os
 from transformers import pipeline
 from dotenv import load_dotenv
 import logging
+from utils.result_cache import cache_key, get_or_compute
 
 # Load environment variables
 load_dotenv()
@@ -111,14 +112,18 @@ class TextSummarizer:
             
             logger.info(f"Summarizing {transcript_words} words -> {max_len} words")
             
-            # Ultra-fast settings
-            summary = self.summarizer(
-                transcript,
-                max_length=max_len,
-                min_length=min_len,
-                do_sample=False,
-                truncation=True,
-            )[0]['summary_text']
+            # Ultra-fast settings; identical transcripts reuse the persisted summary
+            model_id = self.summarizer.model.name_or_path
+            summary = get_or_compute(
+                cache_key(f"{model_id}:summary", transcript),
+                lambda: self.summarizer(
+                    transcript,
+                    max_length=max_len,
+                    min_length=min_len,
+                    do_sample=False,
+                    truncation=True,
+                )[0]['summary_text']
+            )
             
             final_word_count = len(summary.split())
             logger.info(f"Fast summary generated: {final_word_count} words")
@@ -0,0 +1,34 @@
+# utils/request_coalescer.py
+
+import threading
+from concurrent.futures import Future
+
+
+class RequestCoalescer:
+    """
+    Lets concurrent callers asking for the same key share one computation.
+    The first caller runs the work; callers arriving while it is in flight
+    wait for and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def run(self, key, fn, *args):
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._in_flight[key] = Future()
+
+        if is_leader:
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    del self._in_flight[key]
+
+        return future.result()
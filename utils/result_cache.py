@@ -0,0 +1,64 @@
+# utils/result_cache.py
+"""
+Persistent cache of model outputs (summaries, chunk embeddings) shared across restarts.
+The store is bounded: once it would exceed MAX_ENTRIES it is emptied and refilled, which
+keeps disk use to roughly MAX_ENTRIES small values (~35 MB of MiniLM embeddings).
+"""
+
+import os
+import shelve
+import hashlib
+import logging
+import threading
+
+CACHE_PATH = "data/cache/embcache.db"
+MAX_ENTRIES = 20000
+
+logger = logging.getLogger(__name__)
+
+# shelve is not safe for concurrent writers, so every access goes through one lock
+_lock = threading.Lock()
+
+
+def cache_key(model_name, text):
+    """Key a model output by the model that produced it and a hash of its input"""
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    return f"{model_name}:{digest}"
+
+
+def get_many(keys):
+    """Return the cached values for the keys that are present"""
+    try:
+        with _lock, shelve.open(CACHE_PATH, flag='r') as db:
+            return {key: db[key] for key in keys if key in db}
+    except Exception:
+        return {}  # no cache written yet, or unreadable
+
+
+def set_many(items):
+    """Persist several key/value pairs in one write"""
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with _lock:
+            with shelve.open(CACHE_PATH) as db:
+                full = len(db) + len(items) > MAX_ENTRIES
+                if not full:
+                    db.update(items)
+            if full:
+                # flag='n' recreates the files, so the space is actually released
+                logger.info(f"Result cache reached {MAX_ENTRIES} entries, starting a fresh one")
+                with shelve.open(CACHE_PATH, flag='n') as db:
+                    db.update(items)
+    except Exception as e:
+        logger.warning(f"Could not persist result cache: {e}")
+
+
+def get_or_compute(key, compute):
+    """Return the cached value for key, computing and storing it on a miss"""
+    cached = get_many([key])
+    if key in cached:
+        return cached[key]
+
+    value = compute()
+    set_many({key: value})
+    return value
@@ -1,6 +1,22 @@
 import re
 import os
 
+def clean_text(text):
+    """
+    Removes timestamps, symbols, and extra spaces from a piece of transcript text.
+    """
+    cleaned_text = text
+
+    # Remove timestamps like [00:10], (00:10), 00:10, 1:23:45
+    cleaned_text = re.sub(r"\[?\(?\d{1,2}:\d{2}(?::\d{2})?\)?\]?", " ", cleaned_text)
+
+    # Remove special characters, keeping normal punctuation and Hindi letters
+    cleaned_text = re.sub(r"[^a-zA-Z0-9\u0900-\u097F\s.,?!]", " ", cleaned_text)
+
+    # Remove multiple spaces and newlines
+    return re.sub(r"\s+", " ", cleaned_text).strip()
+
+
 def clean_and_save_transcript(input_path):
     """
     Cleans the transcript text (removes timestamps, symbols, and extra spaces)
@@ -16,16 +32,7 @@ def clean_and_save_transcript(input_path):
             return None
 
         # --- Step 2: Cleaning logic ---
-        cleaned_text = text
-
-        # Remove timestamps like [00:10], (00:10), 00:10, 1:23:45
-        cleaned_text = re.sub(r"\[?\(?\d{1,2}:\d{2}(?::\d{2})?\)?\]?", " ", cleaned_text)
-
-        # Remove special characters, keeping normal punctuation and Hindi letters
-        cleaned_text = re.sub(r"[^a-zA-Z0-9\u0900-\u097F\s.,?!]", " ", cleaned_text)
-
-        # Remove multiple spaces and newlines
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text).strip()
+        cleaned_text = clean_text(text)
 
         # --- Step 3: Save the cleaned transcript ---
         base_dir = os.path.dirname(input_path)
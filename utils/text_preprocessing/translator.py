@@ -1,6 +1,54 @@
 from googletrans import Translator
 import os
 import time
+import threading
+
+# googletrans uses an unofficial endpoint, so requests from every thread are spaced out together
+MIN_REQUEST_INTERVAL = 1.0
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+
+def _wait_for_rate_limit():
+    """Block until this thread may send the next translation request"""
+    global _next_request_at
+    with _rate_lock:
+        delay = _next_request_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        _next_request_at = time.monotonic() + MIN_REQUEST_INTERVAL
+
+
+def translate_text(text, translator=None, max_chars=4000):
+    """
+    Translates a piece of text (any language) to English.
+    Long text is sent in safe chunks with retries; raises if a chunk still fails after the last retry.
+    """
+    if translator is None:
+        translator = Translator()
+
+    # --- Split long text into safe chunks ---
+    chunks = [text[i:i+max_chars] for i in range(0, len(text), max_chars)]
+    print(f"[INFO] Detected {len(chunks)} chunks for translation.")
+
+    translated_chunks = []
+    for i, chunk in enumerate(chunks):
+        for attempt in range(3):  # retry up to 3 times per chunk
+            _wait_for_rate_limit()  # prevent hitting rate limits
+            try:
+                translated = translator.translate(chunk, dest='en')
+                translated_chunks.append(translated.text)
+                print(f"[INFO]  Translated chunk {i+1}/{len(chunks)}")
+                break
+            except Exception as e:
+                print(f"[WARN] Chunk {i+1} retry {attempt+1}/3 failed: {e}")
+                last_error = e
+                time.sleep(2)
+        else:
+            raise RuntimeError(f"Translation of chunk {i+1}/{len(chunks)} failed after 3 attempts: {last_error}")
+
+    return "\n".join(translated_chunks)
+
 
 def translate_to_eng(transcript_path):
     """
@@ -8,34 +56,11 @@ def translate_to_eng(transcript_path):
     Creates a new file transcript_english.txt in the same folder.
     """
     try:
-        # Initialize translator
-        translator = Translator()
-
         # Read transcript
         with open(transcript_path, "r", encoding="utf-8") as f:
             text = f.read().strip()
 
-        # --- Split long text into safe chunks ---
-        def split_text(text, max_chars=4000):
-            return [text[i:i+max_chars] for i in range(0, len(text), max_chars)]
-
-        chunks = split_text(text)
-        print(f"[INFO] Detected {len(chunks)} chunks for translation.")
-
-        translated_chunks = []
-        for i, chunk in enumerate(chunks):
-            for attempt in range(3):  # retry up to 3 times per chunk
-                try:
-                    translated = translator.translate(chunk, dest='en')
-                    translated_chunks.append(translated.text)
-                    print(f"[INFO]  Translated chunk {i+1}/{len(chunks)}")
-                    break
-                except Exception as e:
-                    print(f"[WARN] Chunk {i+1} retry {attempt+1}/3 failed: {e}")
-                    time.sleep(2)
-            time.sleep(1)  # prevent hitting rate limits
-
-        english_text = "\n".join(translated_chunks)
+        english_text = translate_text(text)
 
         # Save new file
         base_dir = os.path.dirname(transcript_path)
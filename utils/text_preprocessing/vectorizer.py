@@ -2,16 +2,65 @@
 
 import os
 import pickle
+import logging
+import threading
+import numpy as np
 from sentence_transformers import SentenceTransformer
+from utils.result_cache import cache_key, get_many, set_many
 
-def vectorize_chunks(chunk_dir):
+MODEL_NAME = 'all-MiniLM-L6-v2'
+
+# Backends in order of preference; chunks and questions must be encoded by the same one,
+# since the int8 export shifts cosine scores relative to the fp32 PyTorch model.
+EMBEDDER_OPTIONS = [
+    {"backend": "onnx", "model_kwargs": {"file_name": "onnx/model_qint8_avx512_vnni.onnx"}},
+    {"backend": "openvino"},
+    {"backend": "torch"},
+]
+
+logger = logging.getLogger(__name__)
+
+_embedder = None
+_embedder_backend = None
+_embedder_lock = threading.Lock()
+
+def load_embedder():
     """
-    Vectorizes all text chunks from the given chunk_dir using SentenceTransformer.
-    Saves a single embeddings.pkl file in the same folder and PRESERVES text chunks.
+    Load the shared embedding model once per process, preferring int8 ONNX Runtime, then OpenVINO, then PyTorch.
+    Returns (model, backend); model is None if no backend could be loaded.
     """
-    # Load embedding model
-    model = SentenceTransformer('all-MiniLM-L6-v2')
+    global _embedder, _embedder_backend
+    with _embedder_lock:
+        if _embedder is None:
+            for options in EMBEDDER_OPTIONS:
+                try:
+                    _embedder = SentenceTransformer(MODEL_NAME, **options)
+                    _embedder_backend = options["backend"]
+                    logger.info(f"Embedding model initialized with {_embedder_backend} backend")
+                    break
+                except Exception as e:
+                    logger.warning(f"Could not load {options['backend']} embedding model: {e}")
+        return _embedder, _embedder_backend
 
+def _replace_file(path, write):
+    """
+    Write a new file next to path and atomically swap it in.
+    Readers that memory-mapped the old file keep its inode, so it is never truncated under them.
+    """
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def vectorize_chunks(chunk_dir):
+    """
+    Vectorizes all text chunks from the given chunk_dir with the shared embedder (see load_embedder).
+    Saves embeddings.pkl (and a normalized embeddings.npy) in the same folder and PRESERVES text chunks.
+    """
     # Collect all text chunks
     txt_files = [f for f in os.listdir(chunk_dir) if f.endswith(".txt")]
     if not txt_files:
@@ -26,13 +75,30 @@ def vectorize_chunks(chunk_dir):
         with open(file_path, "r", encoding="utf-8") as f:
             chunks.append(f.read())
 
-    # Generate embeddings
-    embeddings = model.encode(chunks, show_progress_bar=True, batch_size=8)
+    # Generate embeddings, only encoding chunks not seen before with this model and backend
+    model, backend = load_embedder()
+    if model is None:
+        raise RuntimeError(f"Could not load embedding model {MODEL_NAME}")
+    keys = [cache_key(f"{MODEL_NAME}:{backend}", chunk) for chunk in chunks]
+    cached = get_many(keys)
+    missing = [i for i, key in enumerate(keys) if key not in cached]
+    print(f"Reusing {len(chunks) - len(missing)} cached embeddings, encoding {len(missing)}...")
+
+    if missing:
+        new_embeddings = model.encode([chunks[i] for i in missing], show_progress_bar=True, batch_size=8)
+        fresh = {keys[i]: embedding for i, embedding in zip(missing, new_embeddings)}
+        set_many(fresh)
+        cached.update(fresh)
+    embeddings = np.vstack([cached[key] for key in keys])
 
     # Save embeddings.pkl in the same directory
     output_path = os.path.join(chunk_dir, "embeddings.pkl")
-    with open(output_path, "wb") as f:
-        pickle.dump(embeddings, f)
+    _replace_file(output_path, lambda f: pickle.dump(embeddings, f, protocol=pickle.HIGHEST_PROTOCOL))
+
+    # Also save unit-length float32 embeddings.npy so QnA can memory-map them as-is
+    normalized = embeddings.astype(np.float32)
+    normalized /= np.linalg.norm(normalized, axis=1, keepdims=True) + 1e-12
+    _replace_file(os.path.join(chunk_dir, "embeddings.npy"), lambda f: np.save(f, normalized))
 
     print(f"Embeddings saved successfully to: {output_path}")
 
@@ -11,8 +11,20 @@ except ImportError:
     WHISPER_AVAILABLE = False
     print("[WARNING] Whisper not available. Only videos with captions will work.")
 
+# faster-whisper is optional - batches chunk transcription when installed
+try:
+    import numpy as np
+    from faster_whisper import WhisperModel, BatchedInferencePipeline, decode_audio
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
 OUTPUT_TRANSCRIPT = "data/transcripts/transcript.txt"
 
+# Whisper works on 30 s segments of 16 kHz audio
+WHISPER_SEGMENT_SECONDS = 30
+WHISPER_SAMPLE_RATE = 16000
+
 
 def get_youtube_transcript(youtube_url):
     """Fetch YouTube transcript in any available language.
@@ -63,27 +75,93 @@ def get_youtube_transcript(youtube_url):
 
 
 
-def transcribe_audio_to_text(chunks, model_name="tiny", output_path=OUTPUT_TRANSCRIPT):
+def transcribe_audio_to_text(chunks, model_name="tiny", output_path=OUTPUT_TRANSCRIPT, batch_size=16):
     """Transcribe audio chunks using Whisper (fallback method)."""
-    if not WHISPER_AVAILABLE:
+    for _ in iter_audio_transcription(chunks, model_name, output_path, batch_size):
+        pass
+    return output_path
+
+
+def iter_audio_transcription(chunks, model_name="tiny", output_path=OUTPUT_TRANSCRIPT, batch_size=16):
+    """Transcribe audio chunks with Whisper, yielding text as soon as each piece is recognised,
+    so later stages can start early. The transcript file appears once transcription completes.
+    """
+    if FASTER_WHISPER_AVAILABLE:
+        recognitions = _transcribe_batched(chunks, model_name, batch_size)
+    elif WHISPER_AVAILABLE:
+        recognitions = _transcribe_sequential(chunks, model_name)
+    else:
         raise RuntimeError("Whisper is not available. Please use a video with captions, or install Python 3.13 or earlier to use Whisper.")
 
+    return _stream_to_file(recognitions, output_path)
+
+
+def _stream_to_file(recognitions, output_path):
+    """Write each recognised piece to a temp file as it arrives and yield it.
+    The transcript file is replaced only once transcription finishes, so readers never see a partial one.
+    """
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    tmp_path = output_path + ".part"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for i, text in enumerate(recognitions):
+                f.write(text if i == 0 else "\n" + text)
+                f.flush()
+                yield text
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    print("[INFO] Whisper transcription completed.")
+
+
+def _transcribe_sequential(chunks, model_name):
+    """Transcribe chunks one by one with openai-whisper."""
     model = whisper.load_model(model_name)
-    recognitions = []
 
     for chunk_file in chunks:
         print(f"[INFO] Transcribing chunk: {chunk_file}")
         result = model.transcribe(chunk_file)
         text = result.get("text", "").strip()
         if text:
-            recognitions.append(text)
+            yield text
 
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(recognitions))
 
-    print("[INFO] Whisper transcription completed.")
-    return output_path
+def _transcribe_batched(chunks, model_name, batch_size):
+    """Transcribe chunks with faster-whisper, batching segments within bounded windows of audio."""
+    if not chunks:
+        return
+
+    model = BatchedInferencePipeline(model=WhisperModel(model_name, device="auto", compute_type="default"))
+
+    # One window fills a batch of 30 s segments, so memory stays bounded however long the video is
+    window_samples = batch_size * WHISPER_SEGMENT_SECONDS * WHISPER_SAMPLE_RATE
+    print(f"[INFO] Transcribing {len(chunks)} chunks in batches of {batch_size}...")
+    window, window_length = [], 0
+    for chunk_file in chunks:
+        audio = decode_audio(chunk_file, sampling_rate=WHISPER_SAMPLE_RATE)
+        window.append(audio)
+        window_length += len(audio)
+        if window_length >= window_samples:
+            yield from _transcribe_window(model, window, batch_size)
+            window, window_length = [], 0
+
+    if window:
+        yield from _transcribe_window(model, window, batch_size)
+
+
+def _transcribe_window(model, window, batch_size):
+    """Transcribe consecutive decoded chunks as one signal so their segments share batches."""
+    audio = np.concatenate(window)
+    window.clear()  # the joined copy is all that is needed from here on
+
+    # Segments are produced lazily, one batch at a time
+    segments, _ = model.transcribe(audio, batch_size=batch_size)
+    for segment in segments:
+        text = segment.text.strip()
+        if text:
+            yield text
 
 
 def save_youtube_transcript(text, output_path=OUTPUT_TRANSCRIPT):
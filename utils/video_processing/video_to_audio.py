@@ -1,4 +1,8 @@
 import os
+import glob
+import shutil
+import subprocess
+import tempfile
 import yt_dlp
 from pydub import AudioSegment
 import math
@@ -24,3 +28,32 @@ def split_audio_to_chunks(audio_path, chunk_secs=CHUNK_SECONDS, out_dir=TMP_DIR)
         audio[i:i+chunk_ms].export(filename, format="wav")
         chunks.append(filename)
     return chunks
+
+def split_stream_to_chunks(stream, chunk_secs=CHUNK_SECONDS, out_dir=TMP_DIR):
+    """Pipe an uploaded video stream straight into ffmpeg, writing 16 kHz mono wav chunks."""
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.makedirs(out_dir, exist_ok=True)
+    cmd = [
+        "ffmpeg", "-loglevel", "error", "-i", "pipe:0", "-vn",
+        "-ac", "1", "-ar", "16000", "-c:a", "pcm_s16le",
+        "-f", "segment", "-segment_time", str(chunk_secs),
+        os.path.join(out_dir, "chunk_%04d.wav"),
+    ]
+    # stderr goes to a file rather than a pipe, so ffmpeg can never block on it while we feed stdin
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=stderr_file)
+        try:
+            shutil.copyfileobj(stream, proc.stdin, length=1 << 20)
+        except BrokenPipeError:
+            pass  # ffmpeg exited early, its stderr below says why
+        finally:
+            proc.stdin.close()
+
+        if proc.wait() != 0:
+            stderr_file.seek(0)
+            error_tail = stderr_file.read().decode("utf-8", errors="replace").strip()[-1000:]
+            raise RuntimeError(
+                f"ffmpeg could not split the uploaded stream (exit code {proc.returncode}): "
+                f"{error_tail or 'no error output'}"
+            )
+    return sorted(glob.glob(os.path.join(out_dir, "chunk_*.wav")))